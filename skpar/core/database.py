@@ -65,6 +65,8 @@ class Database:
 class Query:
     """Decouple the declaration of query from performing a query."""
 
+    __slots__ = ("database", "model_names", "key")
+
     def __init__(self, model_names, key, database=None):
         """Instantiate a query to be performed later by calling it.
 
@@ -100,9 +102,8 @@ class Query:
             database = self.database
         assert database is not None
         if isinstance(self.model_names, list):
-            result = []
-            for model in self.model_names:
-                result.append(database.get(model, {}).get(self.key))
+            get, key = database.get, self.key
+            result = [get(model, {}).get(key) for model in self.model_names]
         else:
             result = database.get(self.model_names, {}).get(self.key)
         if atleast_1d:
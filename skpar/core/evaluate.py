@@ -14,6 +14,7 @@ DEFAULT_CONFIG = {
     "workroot": None,
     "templatedir": None,
     "keepworkdirs": True,
+    "cachefitness": False,
 }
 
 
@@ -121,9 +122,13 @@ class Evaluator:
         self.weights = normalise([oo.weight for oo in objectives])
         self.tasklist = tasklist  # list of name,options pairs
         self.taskdict = taskdict  # name:function mapping
+        # tasks are the same for every evaluation; initialise them once
+        self.tasks = initialise_tasks(tasklist, taskdict, report=False)
         self.parnames = parameternames
         self.config = config if config is not None else DEFAULT_CONFIG
         self.costf = costf
+        # (iteration, cost) of each evaluated point, if caching is enabled
+        self.cache = {} if self.config.get("cachefitness", False) else None
         if utopia is None:
             self.utopia = np.zeros(len(objectives))
         else:
@@ -153,6 +158,23 @@ class Evaluator:
         Return:
             fitness (float): global fitness of the current design point
         """
+        # Do not repeat the evaluation of an already evaluated point;
+        # there is no point to cache in evaluation-only runs (no parameters)
+        cache = self.cache if parametervalues is not None else None
+        if cache is not None:
+            key = tuple(map(float, parametervalues))
+            try:
+                cached_iteration, cost = cache[key]
+            except KeyError:
+                pass
+            else:
+                self.logger.info(
+                    "Iteration %s: same parameters as iteration %s; "
+                    "reusing its cost.",
+                    iteration,
+                    cached_iteration,
+                )
+                return np.atleast_1d(cost)
 
         # Create individual working directory for each evaluation
         origdir = os.getcwd()
@@ -183,8 +205,6 @@ class Evaluator:
             "taskdict": self.taskdict,
             "objectives": self.objectives,
         }
-        # Initialise and then execute the tasks
-        tasks = initialise_tasks(self.tasklist, self.taskdict, report=False)
         self.logger.info("Iteration %s", iteration)
         self.logger.info("===========================")
         if self.parnames:
@@ -196,7 +216,7 @@ class Evaluator:
         #        do we really need to pass workdir and to os.chdir???
         #        move the for loop to a function.
         #        execute_tasks(tasks, env, database, workdir, logger)
-        for i, task in enumerate(tasks):
+        for i, task in enumerate(self.tasks):
             os.chdir(workdir)
             try:
                 task(env, database)
@@ -209,6 +229,8 @@ class Evaluator:
         # Evaluate global fitness
         cost = self.costf(self.utopia, objvfitness, self.weights)
         self._msg("{:<15s}: {}\n".format("Overall cost", cost))
+        if cache is not None:
+            cache[key] = (iteration, cost)
 
         # Remove iteration-specific working dir if not needed:
         if (not self.config["keepworkdirs"]) and (workroot is not None):
@@ -1,8 +1,11 @@
 """
 Routines to handle the input file of skpar
 """
+
 import os
+import copy
 import json
+import functools
 import yaml
 import skpar.core.taskdict as coretd
 from skpar.core.utils import get_logger
@@ -16,22 +19,35 @@ LOGGER = get_logger(__name__)
 
 
 def get_input(filename):
-    """Read input; Exception for non-existent file."""
-    _, intype = os.path.splitext("filename")
+    """Read input; Exception for non-existent file or invalid content.
+
+    Parsed content is cached by file path and modification time, so
+    repeated reads of an unchanged input file skip the parser; each
+    call returns an independent copy that the caller may modify.
+    """
+    mtime_ns = os.stat(filename).st_mtime_ns
+    spec = _load_input(os.path.abspath(filename), mtime_ns)
+    return copy.deepcopy(spec)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_input(filename, mtime_ns):
+    """Parse JSON or YAML input file; `mtime_ns` is only a cache key."""
+    _, intype = os.path.splitext(filename)
     with open(filename, "r") as infile:
-        if intype == "json":
+        if intype == ".json":
             try:
                 spec = json.load(infile)
-            except (ValueError, json.JSONDecodeError):
-                # json.JSONDecodeError is available only python3.5 onwards
-                LOGGER.critical("Input not a valid JSON")
+            except ValueError as exc:
+                # json.JSONDecodeError is a subclass of ValueError
+                LOGGER.error("Input %s not a valid JSON: %s", filename, exc)
                 raise
         else:
-            # if intype == 'yaml':
+            # if intype == '.yaml':
             try:
                 spec = yaml.safe_load(infile)
-            except yaml.YAMLError:
-                LOGGER.warning("Input not a valid YAML")
+            except yaml.YAMLError as exc:
+                LOGGER.error("Input %s not a valid YAML: %s", filename, exc)
                 raise
     return spec
 
@@ -73,6 +89,11 @@ def parse_input(filename, verbose=True):
     return taskdict, tasklist, objectives, optimisation, config
 
 
+def parse_inputs(filenames, verbose=True):
+    """Parse several input files back to back; return a list of setups."""
+    return [parse_input(filename, verbose=verbose) for filename in filenames]
+
+
 def get_config(userinp, report=True):
     """Parse the arguments of 'config' key in user input"""
     if userinp is None:
@@ -87,6 +108,7 @@ def get_config(userinp, report=True):
         templatedir = os.path.abspath(os.path.expanduser(templatedir))
     config["templatedir"] = templatedir
     config["keepworkdirs"] = userinp.get("keepworkdirs", False)
+    config["cachefitness"] = userinp.get("cachefitness", False)
     # related to interpretation of input file
     if report:
         LOGGER.info("The following configuration was understood:")
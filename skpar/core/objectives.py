@@ -6,6 +6,7 @@ Classes and functions related to the:
     * evaluation of objectives.
 """
 import sys
+import os
 from os.path import normpath, expanduser
 from os.path import join as joinpath
 from os.path import split as splitpath
@@ -14,7 +15,7 @@ import logging
 import yaml
 from pprint import pprint, pformat
 from skpar.core.utils import get_logger, normalise, arr2s
-from skpar.core.utils import get_ranges, f2prange
+from skpar.core.utils import get_ranges, get_range_indexes, f2prange
 from skpar.core.database import Query
 from skpar.core.evaluate import COSTF, ERRF
 
@@ -56,12 +57,13 @@ def parse_weights_keyval(spec, data, normalised=True):
         dflt = spec.get("dflt", 0)
         # Key assumption: data is a structured array, where the keys
         # are already encoded as b'string', hence the use of .encode() below.
-        nn = len(data)
-        ww = np.ones(nn) * dflt
         _keys, _values = data.dtype.names
-        for key, val in spec.items():
-            # notabene: the encode() makes a 'string' in b'string'
-            ww[data[_keys] == key.encode()] = val
+        # notabene: the encode() makes a 'string' in b'string'
+        bspec = {key.encode(): val for key, val in spec.items()}
+        # look up each distinct key once, and scatter back to all items
+        keys, inverse = np.unique(data[_keys], return_inverse=True)
+        ww = np.array([bspec.get(key, dflt) for key in keys], dtype=float)
+        ww = ww[inverse]
     # normalisation
     if normalised:
         ww = normalise(ww)
@@ -152,7 +154,7 @@ def parse_weights(
             else:
                 shape = (nn,)
         assert shape is not None
-        ww = np.ones(shape) * dflt
+        ww = np.full(shape, dflt, dtype=float)
         # parse alterations for explicit data indexes
         # convert from FORTRAN to PYTHON, hence the -1 below
         for k in ikeys:
@@ -177,18 +179,19 @@ def parse_weights(
                 )
                 for ilo, ihi in rngs:
                     # permit overlapping ranges, larger weight overrides:
-                    ww[ilo:ihi][ww[ilo:ihi] < w] = w
+                    np.maximum(ww[ilo:ihi], w, out=ww[ilo:ihi])
         # parse alterations for ranges in the reference data itself
         for k in rfkeys:
             assert refdata.shape == ww.shape
+            # selection buffers, reused across ranges
+            sel = np.empty(ww.shape, dtype=bool)
+            tmp = np.empty(ww.shape, dtype=bool)
             for rng, w in spec.get(k, []):
-                ww[
-                    (rng[0] <= refdata)
-                    & (refdata <= rng[1])
-                    &
-                    # permit overlapping weights, larger value overrides:
-                    (ww < w)
-                ] = w
+                np.greater_equal(refdata, rng[0], out=sel)
+                np.less_equal(refdata, rng[1], out=tmp)
+                sel &= tmp
+                # permit overlapping weights, larger value overrides:
+                np.maximum(ww, w, where=sel, out=ww)
     # normalisation
     if normalised:
         ww = normalise(ww)
@@ -282,8 +285,10 @@ class Objective(object):
         self.verbose = kwargs.get("verbose", False)
         if self.verbose:
             self.msg = self.logger.info
+            self.msglevel = logging.INFO
         else:
             self.msg = self.logger.debug
+            self.msglevel = logging.DEBUG
         # mandatory fields
         self.objtype = spec["type"]
         self.query_key = spec["query"]
@@ -327,6 +332,9 @@ class Objective(object):
         return self.fitness
 
     def summarise(self):
+        # called upon each evaluation; skip formatting if it won't be logged
+        if not self.logger.isEnabledFor(self.msglevel):
+            return
         s = []
         s.append("{:<15s}: {}".format("Objective:", pformat(self.doc)))
         s.append(
@@ -482,11 +490,12 @@ class ObjKeyValuePairs(Objective):
         # normalises according to 'nomalised'
         ww = parse_weights_keyval(subweights, data=self.ref_data, normalised=normalised)
         # eliminate ref_data items with zero subweights
-        mask = np.where(np.invert(np.isclose(ww, np.zeros(ww.shape))))
-        self.query_key = [k.decode() for k in self.ref_data["keys"][mask]]
-        self.ref_data = self.ref_data["values"][mask]
+        # the same items are taken thrice, so find their indexes once
+        keep = np.flatnonzero(~np.isclose(ww, 0.0))
+        self.query_key = [k.decode() for k in self.ref_data["keys"][keep].tolist()]
+        self.ref_data = self.ref_data["values"][keep]
         self.ref_data.flags.writeable = False
-        self.subweights = ww[mask]
+        self.subweights = ww[keep]
         assert self.subweights.shape == self.ref_data.shape
         assert len(self.query_key) == len(self.ref_data)
         self.queries = []
@@ -494,9 +503,17 @@ class ObjKeyValuePairs(Objective):
             self.queries.append(Query(self.model_names, key))
 
     def get(self, database):
-        self.model_data = np.empty(self.ref_data.shape)
-        for ix, query in enumerate(self.queries):
-            self.model_data[ix] = query(database)
+        # one 1-element array per key; a missing (None) item fails the cast
+        values = [query(database) for query in self.queries]
+        for key, value in zip(self.query_key, values):
+            if value.size != 1:
+                raise ValueError(
+                    "Key {} yields {} values, one expected.".format(key, value.size)
+                )
+        if values:
+            self.model_data = np.concatenate(values, dtype=float)
+        else:
+            self.model_data = np.empty(self.ref_data.shape)
         return super().get()
 
 
@@ -616,7 +633,8 @@ class ObjBands(Objective):
         # so try to parse 'align_ref' option.
         if align_ref is not None:
             shift = get_refval(self.ref_data, align_ref)
-            self.ref_data -= shift
+            # without use_ref, ref_data is still the read-only loaded array
+            self.ref_data = self.ref_data - shift
         self.ref_data.flags.writeable = False
 
         # Make up a mask to trim model_data if there is use_model
@@ -653,7 +671,7 @@ class ObjBands(Objective):
             assert self.subweights.shape == shape
         else:
             if self.normalised:
-                self.subweights = np.ones(shape) / self.ref_data.size
+                self.subweights = np.full(shape, 1.0 / self.ref_data.size)
             else:
                 self.subweights = np.ones(shape)
 
@@ -670,7 +688,12 @@ class ObjBands(Objective):
         #              the shift cannot be precomputed; we do it on the fly.
         if self.align_model is not None:
             shift = get_refval(self.model_data, self.align_model)
-            self.model_data -= shift
+            if self.subset_ind is not None:
+                # the subset is already a copy, so shift it in place
+                self.model_data -= shift
+            else:
+                # do not alter the bands held in the model database
+                self.model_data = self.model_data - shift
         return super().get()
 
 
@@ -683,6 +706,29 @@ objectives_mapper = {
 }
 
 
+# Arrays already loaded from reference data files, along with the file
+# modification time, keyed by (absolute path, loader arguments); a file
+# changed on disk replaces its entry, so there is one entry per file in use
+_REFDATA_FILES = {}
+
+
+def _loadtxt(file, loader_args):
+    """Return `np.loadtxt(file, **loader_args)`, parsing unchanged files once.
+
+    A copy is returned, since objectives may shift their reference data
+    in place.
+    """
+    key = (os.path.abspath(file), repr(sorted(loader_args.items())))
+    mtime_ns = os.stat(file).st_mtime_ns
+    cached = _REFDATA_FILES.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        array_data = cached[1]
+    else:
+        array_data = np.loadtxt(file, **loader_args)
+        _REFDATA_FILES[key] = (mtime_ns, array_data)
+    return array_data.copy()
+
+
 def get_refdata(data):
     """Parse the input data and return a corresponding array.
 
@@ -712,7 +758,7 @@ def get_refdata(data):
                 loader_args["unpack"] = False
             # read file
             try:
-                array_data = np.loadtxt(file, **loader_args)
+                array_data = _loadtxt(file, loader_args)
             except ValueError:
                 # `file` was not understood
                 print("np.loadtxt cannot understand the contents of {}".format(file))
@@ -737,12 +783,8 @@ def get_refdata(data):
                 for axis, key in enumerate([key1, key2]):
                     rm_rngs = postprocess.get(key, [])
                     if rm_rngs:
-                        indexes = []
                         # flatten, combine and sort, then delete corresp. object
-                        for rng in get_ranges(rm_rngs):
-                            indexes.extend(list(range(*rng)))
-                        indexes = list(set(indexes))
-                        indexes.sort()
+                        indexes = get_range_indexes(rm_rngs)
                         array_data = np.delete(array_data, obj=indexes, axis=axis)
                 scale = postprocess.get("scale", 1)
                 array_data = array_data * scale
@@ -752,9 +794,10 @@ def get_refdata(data):
             try:
                 # `data` is a dict of key-value data -> transform to structured array
                 dtype = [("keys", "S15"), ("values", "float")]
-                return_data = np.array(
-                    [(key, val) for key, val in data.items()], dtype=dtype
-                )
+                # fill field by field, rather than through a tuple per item
+                return_data = np.empty(len(data), dtype=dtype)
+                return_data["keys"] = list(data.keys())
+                return_data["values"] = list(data.values())
             except TypeError:
                 print("get_refdata cannot understand the contents of data dictionary")
                 print("`data` should contain [string_key: float_value, ] pairs,")
@@ -46,7 +46,7 @@ class Optimiser(object):
         self.parameters = parameters
         if options is None:
             options = {}
-        self.optimise = OPTENGINES[algo](self.parameters, self.evaluate, **options)
+        self.optimise = self.optengine(self.parameters, self.evaluate, **options)
         self.logger = LOGGER
         # report all tasks and objectives
         if verbose:
@@ -19,6 +19,7 @@ The following assumptions are made:
       file by string.format(dict(zip(ParNames,Parvalues)) substitution.
 """
 import os.path
+from operator import attrgetter
 from skpar.core.utils import get_logger
 
 LOGGER = get_logger("__name__")
@@ -177,9 +178,9 @@ def substitute_template(parameters, parnames, templatefile, resultfile):
     with open(templatefile, "r") as fin:
         template = fin.read()
     try:
-        pardict = dict([(p.name, p.value) for p in parameters])
+        pardict = {p.name: p.value for p in parameters}
     except AttributeError:
-        pardict = dict([(name, val) for (name, val) in zip(parnames, parameters)])
+        pardict = dict(zip(parnames, parameters))
     updated = update_template(template, pardict)
     with open(resultfile, "w") as fout:
         fout.write(updated)
@@ -214,7 +215,7 @@ def update_parameters(workroot, templates, parameters, parnames=None):
     """
     # Overwrite parnames with the names of the parameter objects, if available
     try:
-        parnames = [p.name for p in parameters]
+        parnames = list(map(attrgetter("name"), parameters))
     except AttributeError:
         # parameters is a list of floats; double check!
         assert all([isinstance(p, (float, int)) for p in parameters]), "{}".format(
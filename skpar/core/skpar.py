@@ -1,6 +1,8 @@
 """Main environment of SKPAR"""
 import os
+import sys
 import logging
+from operator import attrgetter
 import numpy as np
 from skpar.core.utils import get_logger
 from skpar.core.input import parse_input
@@ -33,7 +35,7 @@ class SKPAR:
         )
         if optimisation is not None:
             algo, options, parameters = optimisation
-            parnames = [p.name for p in parameters]
+            parnames = list(map(attrgetter("name"), parameters))
         else:
             parnames = None
 
@@ -45,6 +47,13 @@ class SKPAR:
 
         # instantiate the optimiser
         if optimisation is not None:
+            # parallel evaluations must not share a working directory
+            if options and options.get("nproc", 1) > 1 and config["workroot"] is None:
+                self.logger.critical(
+                    "nproc > 1 requires workroot in config, so that parallel "
+                    "evaluations do not share a working directory."
+                )
+                sys.exit(2)
             self.do_optimisation = True
             self.logger.info("Instantiating Optimiser")
             self.optimiser = Optimiser(
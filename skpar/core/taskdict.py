@@ -5,7 +5,7 @@ import shlex
 import shutil
 import glob
 import numpy as np
-from skpar.core.utils import get_ranges, get_logger, islistoflists
+from skpar.core.utils import get_range_indexes, get_logger, islistoflists
 from skpar.core.plot import skparplot
 from skpar.core.parameters import update_parameters
 from skpar.core.database import Query
@@ -182,12 +182,8 @@ def get_model_data(
         for axis, key in enumerate([key1, key2]):
             rm_rngs = postprocess.get(key, [])
             if rm_rngs:
-                indexes = []
                 # flatten, combine and sort, then delete corresp. object
-                for rng in get_ranges(rm_rngs):
-                    indexes.extend(list(range(*rng)))
-                indexes = list(set(indexes))
-                indexes.sort()
+                indexes = get_range_indexes(rm_rngs)
                 data = np.delete(data, obj=indexes, axis=axis)
     data = data * scale
     #
@@ -60,6 +60,19 @@ def get_ranges(data):
     return rngs
 
 
+def get_range_indexes(data):
+    """Return the sorted unique indexes covered by ranges, e.g. for np.delete.
+
+    Args:
+        data (int, list of int, list of lists of int): as for `get_ranges`.
+
+    Return:
+        numpy.array: python indexes (counting from 0) within any of the ranges.
+    """
+    indexes = [np.arange(lo, hi) for lo, hi in get_ranges(data)]
+    return np.unique(np.concatenate(indexes))
+
+
 def configure_logger(name, filename="skpar.log", verbosity=logging.INFO):
     """Get parent logger: logging INFO on the console and DEBUG to file."""
     logger = logging.getLogger(name)
@@ -7,6 +7,8 @@
     pp. 291--312.
     """
 import sys
+import math
+import functools
 import numpy as np
 from numpy import pi, sqrt
 from fractions import Fraction
@@ -16,9 +18,119 @@ from pprint import pprint, pformat
 logger = logging.getLogger(__name__)
 
 
+# Decimals kept when matching k-points to symmetry points by exact lookup;
+# rounded components that coincide differ by less than 1.e-4
+_KPT_DECIMALS = 4
+
+# sin(60 deg), for the hexagonal cell
+_SQRT3_2 = math.sqrt(3) / 2.0
+
+# Symmetry points in terms of reciprocal cell-vectors, for lattices where they
+# do not depend on the lattice parameters.
+SymPts_k = {
+    "CUB": {
+        "Gamma": (0, 0, 0),
+        "M": (1.0 / 2.0, 1.0 / 2.0, 0.0),
+        "R": (1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0),
+        "X": (0.0, 1.0 / 2.0, 0.0),
+    },
+    "FCC": {
+        "Gamma": (0.0, 0.0, 0.0),
+        "K": (3.0 / 8.0, 3.0 / 8.0, 3.0 / 4.0),
+        "L": (1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0),
+        "U": (5.0 / 8.0, 1.0 / 4.0, 5.0 / 8.0),
+        "W": (1.0 / 2.0, 1.0 / 4.0, 3.0 / 4.0),
+        "X": (1.0 / 2.0, 0.0, 1.0 / 2.0),
+    },
+    "BCC": {
+        "Gamma": (0.0, 0.0, 0.0),
+        "H": (1.0 / 2.0, -1.0 / 2.0, 1.0 / 2.0),
+        "P": (1.0 / 4.0, 1.0 / 4.0, 1.0 / 4.0),
+        "N": (0.0, 0.0, 1.0 / 2.0),
+    },
+    "HEX": {
+        "Gamma": (0, 0, 0),
+        "A": (0.0, 0.0, 1.0 / 2.0),
+        "H": (1.0 / 3.0, 1.0 / 3.0, 1.0 / 2.0),
+        "K": (1.0 / 3.0, 1.0 / 3.0, 0.0),
+        "L": (1.0 / 2.0, 0.0, 1.0 / 2.0),
+        "M": (1.0 / 2.0, 0.0, 0.0),
+    },
+    "TET": {
+        "Gamma": (0, 0, 0),
+        "A": (1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0),
+        "M": (1.0 / 2.0, 1.0 / 2.0, 0.0),
+        "R": (0.0, 1.0 / 2.0, 1.0 / 2.0),
+        "X": (0.0, 1.0 / 2.0, 0.0),
+        "Z": (0.0, 0.0, 1.0 / 2.0),
+    },
+    "ORC": {
+        "Gamma": (0, 0, 0),
+        "R": (1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0),
+        "S": (1.0 / 2.0, 1.0 / 2.0, 0.0),
+        "T": (0.0, 1.0 / 2.0, 1.0 / 2.0),
+        "U": (1.0 / 2.0, 0.0, 1.0 / 2.0),
+        "X": (1.0 / 2.0, 0.0, 0.0),
+        "Y": (0.0, 1.0 / 2.0, 0.0),
+        "Z": (0.0, 0.0, 1.0 / 2.0),
+    },
+}
+
+
+def _readonly_array(values):
+    """Return a read-only float array of *values*, safe to share."""
+    arr = np.array(values, dtype=np.float64)
+    arr.setflags(write=False)
+    return arr
+
+
+# Cells of the cubic families, for a unit lattice constant
+_CUB_CELL = _readonly_array(np.eye(3))
+_FCC_CELL = _readonly_array([[0, 0.5, 0.5], [0.5, 0, 0.5], [0.5, 0.5, 0]])
+_BCC_CELL = _readonly_array([[-0.5, 0.5, 0.5], [0.5, -0.5, 0.5], [0.5, 0.5, -0.5]])
+
+
+# The above as (labels, N-by-3 array) per lattice, so that symmetry points
+# can be converted to reciprocal lengths with a single matrix product.
+# The arrays are shared by all lattice instances, hence read-only.
+_SYMPTS_FRAC = {
+    name: (tuple(pts), _readonly_array(list(pts.values())))
+    for name, pts in SymPts_k.items()
+}
+
+
+def _get_label_by_kpt(labels, frac):
+    """Return *labels* keyed by the rounded rows of *frac*."""
+    return dict(zip(map(tuple, np.round(frac, _KPT_DECIMALS)), labels))
+
+
+# Symmetry point labels keyed by rounded fractional components, for
+# fast lookup in getSymPtLabel.
+_LABEL_BY_KPT = {
+    name: _get_label_by_kpt(labels, frac)
+    for name, (labels, frac) in _SYMPTS_FRAC.items()
+}
+
+
 class Lattice(object):
     """Generic lattice class."""
 
+    __slots__ = (
+        "name",
+        "scale",
+        "param",
+        "setting",
+        "constants",
+        "primv",
+        "convv",
+        "reciprv",
+        "SymPts_k",
+        "SymPts",
+        "path",
+        "_sympts_frac",
+        "_label_by_kpt",
+    )
+
     def __init__(self, info):
         try:
             self.name = info["type"]
@@ -31,21 +143,24 @@ class Lattice(object):
         except:
             logger.critical("Cannot continue without lattice parameter(s)")
             sys.exit(2)
-        try:
+        if "setting" in info:
             self.setting = info["setting"]
-            lat = get_lattice[self.name](self.param, self.setting)
-        except KeyError:
-            lat = get_lattice[self.name](self.param)
-        self.constants = lat.constants
+        try:
+            # lattice data is cached, hence the parameters must be hashable
+            param = tuple(self.param)
+        except TypeError:
+            param = self.param
+        lat, self.reciprv, sympts, self._sympts_frac, self._label_by_kpt = (
+            get_lattice_data(self.name, param, info.get("setting"), self.scale)
+        )
+        # the cached family instance is shared by all equal lattices:
+        # copy its mutable containers; its cell arrays are read-only
+        self.constants = list(lat.constants)
         self.primv = lat.primv
         self.convv = lat.convv
-        self.SymPts_k = lat.SymPts_k
+        self.SymPts_k = dict(lat.SymPts_k)
+        self.SymPts = dict(sympts)
         self.path = info.get("path", lat.standard_path)
-        #
-        self.reciprv = get_recipr_cell(self.primv, self.scale)
-        self.SymPts = {}
-        for k, v in self.SymPts_k.items():
-            self.SymPts[k] = get_kvec(v, self.reciprv)
 
     def get_kcomp(self, string):
         """Return the k-components given a string label or string set of fraction.
@@ -69,259 +184,174 @@ class Lattice(object):
         return np.array(comp)
 
     def get_kvec(self, kpt):
-        """Return the real space vector corresponding to a k-point."""
-        return get_kvec(kpt, self.reciprv)
+        """Return the real space vector corresponding to a k-point.
+
+        *kpt* may also be an N-by-3 array of k-points, in which case
+        an N-by-3 array of vectors is returned.
+        """
+        return np.asarray(kpt, dtype=np.float64) @ self.reciprv
 
     def __repr__(self):
         return repr_lattice(self)
 
 
-class CUB(object):
+class BravaisLattice(object):
+    """
+    Base class of the lattices whose symmetry points, in terms of reciprocal
+    cell-vectors, do not depend on the lattice parameters (see SymPts_k).
+    Subclasses define `name`, `standard_path` and `set_cell(param)`; the
+    latter sets the lattice constants and the conventional and primitive
+    vectors. `settings` lists the accepted settings; None accepts any.
+    """
+
+    __slots__ = ("setting", "constants", "a", "primv", "convv", "SymPts_k")
+
+    name = None
+    standard_path = None
+    settings = ("curtarolo",)
+
+    def __init__(self, param, setting="curtarolo"):
+        if self.settings is not None and setting not in self.settings:
+            logger.error(
+                'Unsupported setting "{}" for {} lattice'.format(setting, self.name)
+            )
+            sys.exit(2)
+        self.setting = setting
+        self.set_cell(param)
+        # own copy, so that the module-level table is not altered via instances
+        self.SymPts_k = dict(SymPts_k[self.name])
+
+
+class CUB(BravaisLattice):
     """
     This is CUBic, cP lattice
     """
 
+    __slots__ = ()
+
+    name = "CUB"
+    standard_path = "Gamma-X-M-Gamma-R-X|M-R"
+    # any setting is accepted, as none alters the simple cubic cell
+    settings = None
+
     def __init__(self, param, setting=None):
+        super().__init__(param, setting)
+
+    def set_cell(self, param):
         try:
             a = param[0]
-        except TypeError:
+        except (TypeError, IndexError):
             a = param
-        self.setting = setting
         self.constants = [a, a, a, pi / 2, pi / 2, pi / 2]
         self.a = a
-        self.primv = [
-            np.array((a, 0.0, 0.0)),
-            np.array((0.0, a, 0.0)),
-            np.array((0.0, 0.0, a)),
-        ]
+        self.primv = a * _CUB_CELL
         self.convv = self.primv
-        self.SymPts_k = {
-            "Gamma": (0, 0, 0),
-            "M": (1.0 / 2.0, 1.0 / 2.0, 0.0),
-            "R": (1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0),
-            "X": (0.0, 1.0 / 2.0, 0.0),
-        }
-        self.standard_path = "Gamma-X-M-Gamma-R-X|M-R"
 
 
-class FCC(object):
+class FCC(BravaisLattice):
     """
     This is Face Centered Cubic lattice (cF)
     """
 
-    def __init__(self, param, setting="curtarolo"):
+    __slots__ = ()
+
+    name = "FCC"
+    standard_path = "Gamma-X-W-K-Gamma-L-U-W-L-K|U-X"
+
+    def set_cell(self, param):
         try:
             a = param[0]
-        except (TypeError, IndexError) as e:
+        except (TypeError, IndexError):
             a = param
         self.constants = [a, a, a, pi / 2, pi / 2, pi / 2]
         self.a = a
-        self.setting = setting
-        if setting == "curtarolo":
-            self.primv = [
-                np.array((0, a / 2.0, a / 2.0)),
-                np.array((a / 2.0, 0, a / 2.0)),
-                np.array((a / 2.0, a / 2.0, 0)),
-            ]
-            self.convv = [
-                np.array(
-                    (
-                        a,
-                        0,
-                        0,
-                    )
-                ),
-                np.array(
-                    (
-                        0,
-                        a,
-                        0,
-                    )
-                ),
-                np.array(
-                    (
-                        0,
-                        0,
-                        a,
-                    )
-                ),
-            ]
-            # symmetry points in terms of reciprocal lattice vectors
-            self.SymPts_k = {
-                "Gamma": (0.0, 0.0, 0.0),
-                "K": (3.0 / 8.0, 3.0 / 8.0, 3.0 / 4.0),
-                "L": (1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0),
-                "U": (5.0 / 8.0, 1.0 / 4.0, 5.0 / 8.0),
-                "W": (1.0 / 2.0, 1.0 / 4.0, 3.0 / 4.0),
-                "X": (1.0 / 2.0, 0.0, 1.0 / 2.0),
-            }
-            self.standard_path = "Gamma-X-W-K-Gamma-L-U-W-L-K|U-X"
-        else:
-            logger.error(
-                "Unsupported setting {} for {} lattice".format(setting, self.__name__)
-            )
-            sys.exit(2)
+        self.primv = a * _FCC_CELL
+        self.convv = a * _CUB_CELL
 
 
-class BCC(object):
+class BCC(BravaisLattice):
     """
     This is Body Centered Cubic lattice (cF)
     """
 
-    def __init__(self, param, setting="curtarolo"):
+    __slots__ = ()
+
+    name = "BCC"
+    standard_path = "Gamma-H-N-Gamma-P-H|P-N"
+
+    def set_cell(self, param):
         try:
             a = param[0]
-        except (TypeError, IndexError) as e:
+        except (TypeError, IndexError):
             a = param
         self.constants = [a, a, a, pi / 2, pi / 2, pi / 2]
         self.a = a
-        self.setting = setting
-        if setting == "curtarolo":
-            self.primv = [
-                np.array((-a / 2.0, a / 2.0, a / 2.0)),
-                np.array((a / 2.0, -a / 2.0, a / 2.0)),
-                np.array((a / 2.0, a / 2.0, -a / 2.0)),
-            ]
-            self.convv = [
-                np.array(
-                    (
-                        a,
-                        0,
-                        0,
-                    )
-                ),
-                np.array(
-                    (
-                        0,
-                        a,
-                        0,
-                    )
-                ),
-                np.array(
-                    (
-                        0,
-                        0,
-                        a,
-                    )
-                ),
-            ]
-            self.SymPts_k = {
-                "Gamma": (0.0, 0.0, 0.0),
-                "H": (1.0 / 2.0, -1.0 / 2.0, 1.0 / 2.0),
-                "P": (1.0 / 4.0, 1.0 / 4.0, 1.0 / 4.0),
-                "N": (0.0, 0.0, 1.0 / 2.0),
-            }
-            self.standard_path = "Gamma-H-N-Gamma-P-H|P-N"
-        else:
-            logger.error(
-                'Unsupported setting "{}" for {} lattice'.format(setting, self.__name__)
-            )
-            sys.exit(2)
+        self.primv = a * _BCC_CELL
+        self.convv = a * _CUB_CELL
 
 
-class HEX(object):
+class HEX(BravaisLattice):
     """
     This is HEXAGONAL, hP lattice
     """
 
-    def __init__(self, param, setting="curtarolo"):
+    __slots__ = ("c",)
+
+    name = "HEX"
+    standard_path = "Gamma-M-K-Gamma-A-L-H-A|L-M|K-H"
+
+    def set_cell(self, param):
         a, c = param[:2]
         self.constants = [a, a, c, pi / 2, pi / 2, 2 * pi / 3]
         self.a = a
         self.c = c
-        self.setting = setting
-        if setting == "curtarolo":
-            self.primv = [
-                np.array((a / 2.0, -a * np.sqrt(3) / 2.0, 0.0)),
-                np.array((a / 2.0, +a * np.sqrt(3) / 2.0, 0.0)),
-                np.array((0, 0, c)),
+        self.primv = np.array(
+            [
+                [a / 2.0, -a * _SQRT3_2, 0.0],
+                [a / 2.0, +a * _SQRT3_2, 0.0],
+                [0, 0, c],
             ]
-            self.convv = self.primv
-            self.SymPts_k = {
-                "Gamma": (0, 0, 0),
-                "A": (0.0, 0.0, 1.0 / 2.0),
-                "H": (1.0 / 3.0, 1.0 / 3.0, 1.0 / 2.0),
-                "K": (1.0 / 3.0, 1.0 / 3.0, 0.0),
-                "L": (1.0 / 2.0, 0.0, 1.0 / 2.0),
-                "M": (1.0 / 2.0, 0.0, 0.0),
-            }
-            self.standard_path = "Gamma-M-K-Gamma-A-L-H-A|L-M|K-H"
-        else:
-            logger.error(
-                'Unsupported setting "{}" for {} lattice'.format(setting, self.__name__)
-            )
-            sys.exit(2)
+        )
+        self.convv = self.primv
 
 
-class TET(object):
+class TET(BravaisLattice):
     """
     This is TETRAGONAL, tP lattice
     """
 
-    def __init__(self, param, setting="curtarolo"):
+    __slots__ = ("c",)
+
+    name = "TET"
+    standard_path = "Gamma-X-M-Gamma-Z-R-A-Z|X-R|M-A"
+
+    def set_cell(self, param):
         a, c = param[:2]
         self.constants = [a, a, c, pi / 2, pi / 2, pi / 2]
         self.a = a
         self.c = c
-        self.setting = setting
-        if setting == "curtarolo":
-            self.primv = [
-                np.array((a, 0.0, 0.0)),
-                np.array((0.0, a, 0.0)),
-                np.array((0.0, 0.0, c)),
-            ]
-            self.convv = self.primv
-            self.SymPts_k = {
-                "Gamma": (0, 0, 0),
-                "A": (1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0),
-                "M": (1.0 / 2.0, 1.0 / 2.0, 0.0),
-                "R": (0.0, 1.0 / 2.0, 1.0 / 2.0),
-                "X": (0.0, 1.0 / 2.0, 0.0),
-                "Z": (0.0, 0.0, 1.0 / 2.0),
-            }
-            self.standard_path = "Gamma-X-M-Gamma-Z-R-A-Z|X-R|M-A"
-        else:
-            logger.error(
-                "Unsupported setting {} for {} lattice".format(setting, self.__name__)
-            )
-            sys.exit(2)
+        self.primv = np.diag(np.array((a, a, c), dtype=np.float64))
+        self.convv = self.primv
 
 
-class ORC(object):
+class ORC(BravaisLattice):
     """
     This is ORTHOROMBIC, oP lattice
     """
 
-    def __init__(self, param, setting="curtarolo"):
+    __slots__ = ("b", "c")
+
+    name = "ORC"
+    standard_path = "Gamma-X-S-Y-Gamma-Z-U-R-T-Z|Y-T|U-X|S-R"
+
+    def set_cell(self, param):
         a, b, c = param[:3]
         self.constants = [a, b, c]
         self.a = a
         self.b = b
         self.c = c
-        self.setting = setting
-        if setting == "curtarolo":
-            self.primv = [
-                np.array((a, 0.0, 0.0)),
-                np.array((0.0, b, 0.0)),
-                np.array((0.0, 0.0, c)),
-            ]
-            self.convv = self.primv
-            self.SymPts_k = {
-                "Gamma": (0, 0, 0),
-                "R": (1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0),
-                "S": (1.0 / 2.0, 1.0 / 2.0, 0.0),
-                "T": (0.0, 1.0 / 2.0, 1.0 / 2.0),
-                "U": (1.0 / 2.0, 0.0, 1.0 / 2.0),
-                "X": (1.0 / 2.0, 0.0, 0.0),
-                "Y": (0.0, 1.0 / 2.0, 0.0),
-                "Z": (0.0, 0.0, 1.0 / 2.0),
-            }
-            self.standard_path = "Gamma-X-S-Y-Gamma-Z-U-R-T-Z|Y-T|U-X|S-R"
-        else:
-            logger.error(
-                "Unsupported setting {} for {} lattice".format(setting, self.__name__)
-            )
-            sys.exit(2)
+        self.primv = np.diag(np.array((a, b, c), dtype=np.float64))
+        self.convv = self.primv
 
 
 class RHL(object):
@@ -332,6 +362,21 @@ class RHL(object):
     Two variations exists: RHL1 (alpha < 90) and RHL2 (alpha > 90)
     """
 
+    __slots__ = (
+        "name",
+        "setting",
+        "constants",
+        "a",
+        "angle",
+        "alpha_rad",
+        "eta",
+        "nu",
+        "primv",
+        "convv",
+        "SymPts_k",
+        "standard_path",
+    )
+
     def __init__(self, param, setting=None):
         """
         Initialise the lattice parameter(s) upon instance creation, and
@@ -347,24 +392,26 @@ class RHL(object):
         a, alpha = param[:2]
         self.setting = setting
         assert not abs(alpha - 90.0) < 1.0e-5
-        self.alpha_rad = np.radians(alpha)
+        self.alpha_rad = math.radians(alpha)
         self.constants = [a, a, a, alpha, alpha, alpha]
         self.a = a
         self.angle = alpha
-        c1 = np.cos(self.alpha_rad)
-        c2 = np.cos(self.alpha_rad / 2.0)
-        s2 = np.sin(self.alpha_rad / 2.0)
-        self.primv = [
-            self.a * np.array([c2, -s2, 0.0]),
-            self.a * np.array([c2, +s2, 0.0]),
-            self.a * np.array([c1 / c2, 0.0, np.sqrt(1 - (c1 / c2) ** 2)]),
-        ]
+        c1 = math.cos(self.alpha_rad)
+        c2 = math.cos(self.alpha_rad / 2.0)
+        s2 = math.sin(self.alpha_rad / 2.0)
+        self.primv = self.a * np.array(
+            [
+                [c2, -s2, 0.0],
+                [c2, +s2, 0.0],
+                [c1 / c2, 0.0, math.sqrt(1 - (c1 / c2) ** 2)],
+            ]
+        )
         self.convv = self.primv
         # The fractions defining the symmetry points in terms of reciprocal vectors
         # are dependent on the angle alpha of the RHL lattice
         # So we cannot use the dictionary SymPts_k to get them.
         if self.alpha_rad < pi / 2.0:
-            eta = (1 + 4 * np.cos(self.alpha_rad)) / (2 + 4 * np.cos(self.alpha_rad))
+            eta = (1 + 4 * c1) / (2 + 4 * c1)
             nu = 3.0 / 4.0 - eta / 2.0
             self.SymPts_k = {
                 "Gamma": (0, 0, 0),
@@ -383,7 +430,7 @@ class RHL(object):
             self.standard_path = "Gamma-L-B1|B-Z-Gamma-X|Q-F-P1-Z|L-P"
         else:
             self.name = "RHL2"
-            eta = 1.0 / (2 * (np.tan(self.alpha_rad / 2.0)) ** 2)
+            eta = 1.0 / (2 * (s2 / c2) ** 2)
             nu = 3.0 / 4.0 - eta / 2.0
             self.SymPts_k = {
                 "Gamma": (0, 0, 0),
@@ -410,6 +457,20 @@ class MCL(object):
     Note that conventional and primitive cells are the same.
     """
 
+    __slots__ = (
+        "setting",
+        "constants",
+        "a",
+        "b",
+        "c",
+        "angle",
+        "beta_rad",
+        "primv",
+        "convv",
+        "SymPts_k",
+        "standard_path",
+    )
+
     def __init__(self, param, setting="curtarolo"):
         """
         The default setting assumes that alpha < 90 as in
@@ -417,7 +478,7 @@ class MCL(object):
         TODO: support for setting='ITC'
         """
         a, b, c, beta = param[:4]
-        self.beta_rad = np.radians(beta)
+        self.beta_rad = math.radians(beta)
         self.constants = [a, b, c, pi / 2, self.beta_rad, pi / 2]
         self.a = a
         self.b = b
@@ -428,15 +489,15 @@ class MCL(object):
             assert (a <= c) and (b <= c) and (beta < 90)
             a1c = a * np.array([1, 0, 0])
             a2c = b * np.array([0, 1, 0])
-            a3c = c * np.array([0, np.cos(self.beta_rad), np.sin(self.beta_rad)])
+            cosb = math.cos(self.beta_rad)
+            sinb = math.sin(self.beta_rad)
+            a3c = c * np.array([0, cosb, sinb])
             self.convv = np.array([a1c, a2c, a3c])
             # primitive cell
             self.primv = self.convv
             #
-            eta = (1 - self.b * np.cos(self.beta_rad) / self.c) / (
-                2 * (np.sin(self.beta_rad)) ** 2
-            )
-            nu = 1.0 / 2.0 - eta * self.c * np.cos(self.beta_rad) / self.b
+            eta = (1 - self.b * cosb / self.c) / (2 * sinb**2)
+            nu = 1.0 / 2.0 - eta * self.c * cosb / self.b
             self.SymPts_k = {
                 "Gamma": (0.0, 0.0, 0.0),
                 "A": (1.0 / 2.0, 1.0 / 2.0, 0.0),
@@ -458,7 +519,9 @@ class MCL(object):
             self.standard_path = "Gamma-Y-H-C-E-M1-A-X-H1|M-D-Z|Y-D"
         else:
             logger.error(
-                "Unsupported setting {} for {} lattice".format(setting, self.__name__)
+                "Unsupported setting {} for {} lattice".format(
+                    setting, type(self).__name__
+                )
             )
             sys.exit(2)
 
@@ -470,6 +533,20 @@ class MCLC(object):
     a <> b <> c, and alpha <> 90 degrees, beta = gamma = 90 degrees
     """
 
+    __slots__ = (
+        "setting",
+        "constants",
+        "a",
+        "b",
+        "c",
+        "angle",
+        "angle_rad",
+        "primv",
+        "convv",
+        "SymPts_k",
+        "standard_path",
+    )
+
     def __init__(self, param, setting="ITC"):
         """
         Note that MCLC has several variants, depending on abc ordering and
@@ -482,16 +559,18 @@ class MCLC(object):
         self.a = a
         self.b = b
         self.c = c
-        self.angle_rad = np.radians(angle)
+        self.angle_rad = math.radians(angle)
         self.angle = angle
         self.constants = [a, b, c, angle]
         self.setting = setting
         if setting == "ITC" and self.angle_rad > pi / 2.0:
             assert (a >= b) and (a >= c) and (angle > 90)
+            cosa = math.cos(self.angle_rad)
+            sina = math.sin(self.angle_rad)
             # conventional cell
             a1c = self.a * np.array([1, 0, 0])
             a2c = self.b * np.array([0, 1, 0])
-            a3c = self.c * np.array([np.cos(self.angle_rad), 0, np.sin(self.angle_rad)])
+            a3c = self.c * np.array([cosa, 0, sina])
             self.convv = np.array([a1c, a2c, a3c])
             # primitive cell
             a1p = (+a1c + a2c) / 2.0
@@ -502,13 +581,10 @@ class MCLC(object):
             # The fractions defining the symmetry points in terms of reciprocal
             # cell-vectors are dependent on the angle alpha of the MCLC lattice
             # So we cannot use the dictionary SymPts_k to get them.
-            psi = 3.0 / 4.0 - (self.b / (2 * self.a * np.sin(self.angle_rad))) ** 2
-            phi = psi - (3.0 / 4.0 - psi) * (self.a / self.c) * np.cos(self.angle_rad)
-            ksi = (2 + (self.a / self.c) * np.cos(self.angle_rad)) / (
-                2 * np.sin(self.angle_rad)
-            ) ** 2
-            eta = 1.0 / 2.0 - 2 * ksi * (self.c / self.a) * np.cos(self.angle_rad)
-            # logger.debug ((psi, phi, ksi, eta))
+            psi = 3.0 / 4.0 - (self.b / (2 * self.a * sina)) ** 2
+            phi = psi - (3.0 / 4.0 - psi) * (self.a / self.c) * cosa
+            ksi = (2 + (self.a / self.c) * cosa) / (2 * sina) ** 2
+            eta = 1.0 / 2.0 - 2 * ksi * (self.c / self.a) * cosa
             self.SymPts_k = {
                 "Gamma": (0.0, 0.0, 0.0),
                 "N": (0.0, 1.0 / 2.0, 0.0),
@@ -530,19 +606,59 @@ class MCLC(object):
             self.standard_path = "X1-Y-Gamma-N-X-Gamma-M-I-L-F-Y-Gamma-Z-F1-Z-I1"
         else:
             logger.error(
-                "Unsupported setting {} for {} lattice".format(setting, self.__name__)
+                "Unsupported setting {} for {} lattice".format(
+                    setting, type(self).__name__
+                )
             )
             sys.exit(2)
 
 
+@functools.lru_cache(maxsize=128)
+def get_lattice_data(name, param, setting=None, scale=2 * pi):
+    """
+    Return the lattice family instance for *name*, *param* and *setting*
+    (the default setting of the family if None), the reciprocal cell scaled
+    by *scale*, the symmetry points in reciprocal lengths, the symmetry point
+    labels along with an array of their fractional components, and the
+    labels keyed by the rounded fractional components.
+
+    The result is cached, since the same lattice is typically set up anew
+    for every band-structure evaluation; the family instance and the arrays
+    are shared, hence the arrays are returned read-only, and callers must
+    copy the containers of the family instance before altering them.
+    """
+    if setting is None:
+        lat = get_lattice[name](param)
+    else:
+        lat = get_lattice[name](param, setting)
+    reciprv = get_recipr_cell(lat.primv, scale)
+    try:
+        labels, frac = _SYMPTS_FRAC[name]
+        label_by_kpt = _LABEL_BY_KPT[name]
+    except KeyError:
+        # symmetry points depend on the lattice parameters
+        labels = tuple(lat.SymPts_k)
+        frac = _readonly_array(list(lat.SymPts_k.values()))
+        label_by_kpt = _get_label_by_kpt(labels, frac)
+    kvecs = get_kvec(frac, reciprv)
+    lat.primv.setflags(write=False)
+    lat.convv.setflags(write=False)
+    reciprv.setflags(write=False)
+    kvecs.setflags(write=False)
+    sympts = dict(zip(labels, kvecs))
+    return lat, reciprv, sympts, (labels, frac), label_by_kpt
+
+
 def get_kvec(comp_rc, recipr_cell):
     """
     *comp_rc* are the components of a vector expressed in terms of
     reciprocal cell vectors *recipr_cell*.
     Return the components of this vector in terms of reciprocal
     unit vectors.
+    *comp_rc* may also be an array of shape (..., 3), e.g. a list of
+    k-points, in which case all are converted with a single product.
     """
-    kvec = np.dot(np.array(comp_rc), np.array(recipr_cell))
+    kvec = np.asarray(comp_rc) @ np.asarray(recipr_cell)
     # the above is equivalent to: kvec = np.sum([beta[i]*Bvec[i] for i in range(3)], axis=0)
     return kvec
 
@@ -556,20 +672,35 @@ def get_recipr_cell(A, scale):
     B0 = scale * (A1 x A2)/(A0 . A1 x A2)
     B1 = scale * (A2 x A0)/(A0 . A1 x A2)
     B2 = scale * (A0 x A1)/(A0 . A1 x A2)
-    and are returnd as a list of 1D arrays.
+    and are returned as the rows of a 3x3 array.
     Recall that the triple-scalar product is invariant under circular shift,
     and equals the (signed) volume of the primitive cell.
-    """
-    volume = np.dot(A[0], np.cross(A[1], A[2]))
-    B = []
-    # use this to realise circular shift
-    index = np.array(list(range(len(A))))
-    for i in range(len(A)):
-        (i1, i2) = np.roll(index, -(i + 1))[0:2]
-        B.append(scale * np.cross(A[i1], A[i2]) / volume)
+    The above is identical to B = scale * inv(A).T, which is how B is
+    computed, since a single inversion is much faster than the cross products.
+    *A* may also be a stack of cells, of shape (N, 3, 3).
+    The result is C-contiguous, not a transposed view, for the matmuls that
+    follow. Round-off of the inversion is zeroed (as are negative zeros),
+    so that vanishing components are exact, as with the cross products.
+    """
+    A = np.asarray(A, dtype=np.float64)
+    B = np.ascontiguousarray(scale * np.swapaxes(np.linalg.inv(A), -1, -2))
+    tol = 1e-15 * np.abs(B).max(axis=(-2, -1), keepdims=True)
+    B[np.abs(B) <= tol] = 0.0
     return B
 
 
+def get_sympts_batch(name, params, scale=2 * pi):
+    """
+    Return the labels and the symmetry points in reciprocal lengths of
+    lattices of type *name* (one of those in SymPts_k), for each of the
+    lattice parameter(s) in *params*. The points are returned as an
+    array of shape (len(params), len(labels), 3).
+    """
+    labels, frac = _SYMPTS_FRAC[name]
+    primv = np.array([get_lattice[name](param).primv for param in params])
+    return labels, frac @ get_recipr_cell(primv, scale)
+
+
 def getSymPtLabel(kvec, lattice):
     """Return the symbol corresponding to a given k-vector, if named.
 
@@ -577,13 +708,18 @@ def getSymPtLabel(kvec, lattice):
     given in terms of reciprocal cell-vectors (*kvec* -- a 3-tuple)
     of the *lattice* object.
     """
-    kLabel = None
+    # exact match of the rounded components first; points that agree within
+    # the tolerance below, but round differently, are found by the scan
+    kLabel = lattice._label_by_kpt.get(tuple(np.round(kvec, _KPT_DECIMALS)))
 
     # the tollerance bellow (atol) defines how loosely we can define the
     # k-points in the dftb_in.hsd. 1.e-4 means we need 3 digits after the dot.
-    for lbl, kpt in list(lattice.SymPts_k.items()):
-        if np.allclose(kvec, kpt, atol=1.0e-4):
-            kLabel = lbl
+    if kLabel is None:
+        labels, frac = lattice._sympts_frac
+        # same test as np.allclose(kvec, kpt), for all points at once
+        matches = np.isclose(kvec, frac, atol=1.0e-4).all(axis=1).nonzero()[0]
+        if matches.size:
+            kLabel = labels[matches[-1]]
 
     if not kLabel:
         logger.warning(
@@ -592,29 +728,50 @@ def getSymPtLabel(kvec, lattice):
             )
         )
         logger.warning("\tReturning fractions of reciprocal unit vectors")
-        kx = Fraction(kvec[0]).limit_denominator()
-        ky = Fraction(kvec[1]).limit_denominator()
-        kz = Fraction(kvec[2]).limit_denominator()
         kLabel = "({0}/{1}, {2}/{3}, {4}/{5})".format(
-            kx.numerator,
-            kx.denominator,
-            ky.numerator,
-            ky.denominator,
-            kz.numerator,
-            kz.denominator,
+            *_to_fraction(kvec[0]), *_to_fraction(kvec[1]), *_to_fraction(kvec[2])
         )
     return kLabel
 
 
-def getkLineLength(kpt0, kpt1, Bvec, scale):
+def _to_fraction(x):
+    """Return numerator and denominator of the fraction closest to *x*.
+
+    The result is that of Fraction(x).limit_denominator(), but the small
+    denominators typical of k-points are tried first, which is much faster.
+    Any other fraction with denominator up to 1e6 is at least 1e-7 away
+    from one with denominator up to 8, so the fast path cannot differ.
+    """
+    for den in range(1, 9):
+        num = int(round(x * den))
+        if abs(x * den - num) < 1.0e-9:
+            return num, den
+    frac = Fraction(x).limit_denominator()
+    return frac.numerator, frac.denominator
+
+
+def getkLineLength(kpt0, kpt1, Bvec, scale=1.0):
     """
     Given two k-points in terms of unit vectors of the reciprocal lattice, Bvec,
     return the distance between the two points, in terms of reciprocal length.
+    Bvec already carries the 2pi factor; *scale* only converts the result to
+    other units, e.g. a/2pi for lengths in 2pi/a.
     """
-    k0 = np.dot(np.array(kpt0), np.array(Bvec))
-    k1 = np.dot(np.array(kpt1), np.array(Bvec))
-    klen = scale * np.linalg.norm(k0 - k1)
-    return klen
+    return get_kpath_lengths((kpt0, kpt1), Bvec, scale)[0]
+
+
+def get_kpath_lengths(kpts, Bvec, scale=1.0):
+    """
+    Given N k-points in terms of unit vectors of the reciprocal lattice, Bvec,
+    return the N-1 distances between consecutive points, in reciprocal length,
+    converted by *scale* as in getkLineLength.
+    """
+    # the map to reciprocal lengths is linear, so take the differences first
+    dk = np.diff(np.asarray(kpts, dtype=np.float64), axis=0) @ np.asarray(Bvec)
+    seglens = np.linalg.norm(dk, axis=1)
+    if scale != 1.0:
+        seglens *= scale
+    return seglens
 
 
 def repr_lattice(lat):
@@ -642,15 +799,15 @@ def repr_lattice(lat):
         s.append("{}".format(rvec))
 
     s.append("Symmetry points in terms of reciprocal lattice vectors:")
-    for pt in list(lat.SymPts_k.items()):
+    for pt in lat.SymPts_k.items():
         s.append("{:>6s}: {}".format(pt[0], pt[1]))
 
     s.append("Symmetry points in reciprocal lengths:")
-    for pt in list(lat.SymPts.items()):
+    for pt in lat.SymPts.items():
         s.append("{:>6s}: {}".format(pt[0], pt[1]))
 
     s.append("Symmetry points in 2pi/a units:")
-    for pt in list(lat.SymPts.items()):
+    for pt in lat.SymPts.items():
         s.append("{:>6s}: {}".format(pt[0], pt[1] / (2 * pi / lat.constants[0])))
 
     s.append("Lengths along a standard path [2pi/a]:")
@@ -673,18 +830,21 @@ def len_pathsegments(lattice, scale=None, path=None):
     ]
     for subpath in path.split("|"):
         segments = subpath.split("-")
-        for i, pt in enumerate(segments[:-1]):
-            nextpt = segments[i + 1]
-            s.append(
-                "{:>6s}-{:<6s}: {:.3f}".format(
-                    pt,
-                    nextpt,
-                    scale * np.linalg.norm(lattice.SymPts[pt] - lattice.SymPts[nextpt]),
-                )
-            )
+        seglengths = scale * get_segment_lengths(lattice, segments)
+        for pt, nextpt, seglen in zip(segments[:-1], segments[1:], seglengths):
+            s.append("{:>6s}-{:<6s}: {:.3f}".format(pt, nextpt, seglen))
     return "\n".join(s)
 
 
+def get_segment_lengths(lattice, segments):
+    """
+    Return the lengths (in reciprocal units) of the consecutive segments
+    between the symmetry points listed in *segments* (a sequence of labels).
+    """
+    kpts = np.array([lattice.SymPts[pt] for pt in segments])
+    return np.linalg.norm(np.diff(kpts, axis=0), axis=1)
+
+
 def get_dftbp_klines(lattice, delta=None, path=None):
     """
     Print out the number of points along each segment of the BZ *path*
@@ -700,31 +860,12 @@ def get_dftbp_klines(lattice, delta=None, path=None):
     s.append("# {:s}".format(path))
     for subpath in path.split("|"):
         segments = subpath.split("-")
-        pt = segments[0]
-        npts = 1
-        len = 0
-        s.append(
-            "{:>8d} {:s}  # {:<6s}  {:<8.3f}".format(
-                npts,
-                "".join(["{:>10.5f}".format(comp) for comp in lattice.SymPts_k[pt]]),
-                pt,
-                len,
-            )
-        )
-        for i, pt in enumerate(segments[:-1]):
-            nextpt = segments[i + 1]
-            len = np.linalg.norm(lattice.SymPts[pt] - lattice.SymPts[nextpt])
-            npts = int(len / delta)
-            s.append(
-                "{:>8d} {:s}  # {:<6s}  {:<8.3f}".format(
-                    npts,
-                    "".join(
-                        ["{:>10.5f}".format(comp) for comp in lattice.SymPts_k[nextpt]]
-                    ),
-                    nextpt,
-                    len,
-                )
-            )
+        seglengths = get_segment_lengths(lattice, segments)
+        npoints = [1] + [int(seglen / delta) for seglen in seglengths]
+        seglengths = [0] + list(seglengths)
+        for pt, npts, seglen in zip(segments, npoints, seglengths):
+            kcomp = "".join(["{:>10.5f}".format(comp) for comp in lattice.SymPts_k[pt]])
+            s.append("{:>8d} {:s}  # {:<6s}  {:<8.3f}".format(npts, kcomp, pt, seglen))
     return "\n".join(s)
 
 
@@ -5,7 +5,6 @@ from os.path import abspath, expanduser, isdir
 from os.path import join as joinpath
 from math import pi
 import numpy as np
-from collections import OrderedDict
 from skpar.dftbutils.lattice import Lattice, getSymPtLabel
 from skpar.dftbutils.querykLines import get_klines, get_kvec_abscissa
 from skpar.dftbutils.utils import get_logger
@@ -491,7 +490,7 @@ def calc_masseff(
     klen = np.linalg.norm(k2 - k1)  # length of the vector from k1 to k2
     kline = dklen * np.array(range(nk))  # reconstruction of kline, in units of A^{-1}
 
-    meff_data = OrderedDict([])  # permits list-like extraction of data too
+    meff_data = {}  # insertion-ordered; permits list-like extraction too
 
     for ib in range(nb):
         # logger.debug('Fitting effective mass {}.'.format(meff_id(ib)))
@@ -600,7 +599,7 @@ def calc_masseff(
 
 def expand_meffdata(meff_data):
     """ """
-    expanded_data = OrderedDict()
+    expanded_data = {}
     for k, v in meff_data.items():
         tagdict = {"me": ("cbmin", "cbminpos"), "mh": ("vbmax", "vbmaxpos")}
         tagbits = k.split("_")
@@ -651,7 +650,7 @@ def get_effmasses(
     `Erange` is the energy range over which parabolic expansion is attempted
     """
     logger = implargs.get("logger", LOGGER)
-    masses = OrderedDict()
+    masses = {}
     src_db = database.get(source)
     bands = src_db["bands"]
     nE, nk = bands.shape
@@ -804,7 +803,7 @@ def get_Ek(bsdata, sympts):
     """ """
     bands = bsdata["bands"]
     kLinesDict = bsdata["kLinesDict"]
-    Ek = OrderedDict()
+    Ek = {}
     # wrap this in try:except, and catch label not in kLinesDict
     kindexes = [kLinesDict[label][0] for label in sympts]
     for ix, label in zip(kindexes, sympts):
@@ -125,20 +125,21 @@ def get_kvec_abscissa(lat, kLines):
     skipticklabel = False
     logger.debug("Constructing k-vector abscissa for BS plotting:")
     logger.debug("kLines:\n{}".format(kLines))
+    # lengths of all segments between consecutive points, in one go
+    kpts = np.array([lat.get_kcomp(lbl) for lbl, _ in kLines], dtype=float)
+    seglens = np.linalg.norm(lat.get_kvec(np.diff(kpts, axis=0)), axis=1)
     pos = 0
     xx.append(np.atleast_1d(pos))
-    for item1, item2 in zip(kLines[:-1], kLines[1:]):
+    for item1, item2, kseglen in zip(kLines[:-1], kLines[1:], seglens):
         l1, i1 = item1
-        kp1 = lat.get_kcomp(l1)
         l2, i2 = item2
-        kp2 = lat.get_kcomp(l2)
         nseg = i2 - i1
         if l1 == "Gamma":
             l1 = "Γ"
         if l2 == "Gamma":
             l2 = "Γ"
         if nseg > 1:
-            seglen = np.linalg.norm(lat.get_kvec(kp2 - kp1))
+            seglen = kseglen
             xsegm, delta = np.linspace(0, seglen, nseg + 1, retstep=True)
             if not skipticklabel:
                 xt.append(pos)
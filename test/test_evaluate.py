@@ -28,6 +28,11 @@ def fexception(env, db, exception=None):
         return None
 
 
+def fcount(env, db, counter):
+    """count the calls in the `counter` list"""
+    counter.append(env["parametervalues"])
+
+
 class EvaluatorTest(unittest.TestCase):
     """Check if we can create an evaluator."""
 
@@ -39,6 +44,7 @@ class EvaluatorTest(unittest.TestCase):
         parnames = ["p0"]
         evaluator = ev.Evaluator(objvs, tasklist, taskdict, parnames)
         nptest.assert_array_equal(evaluator.weights, np.array([0.5, 0.5]))
+        self.assertEqual([task.name for task in evaluator.tasks], ["t1", "t2"])
         params, iteration = [2.0], 1
         fitness = evaluator(params, iteration)
         self.assertEqual(fitness, 2)
@@ -68,6 +74,32 @@ class EvaluatorTest(unittest.TestCase):
         par, ii = [2.0], 1
         self.assertRaises(RuntimeError, evaluator, par, ii)
 
+    def test_evaluator_cachefitness(self):
+        """Are repeated points evaluated only once if caching is enabled?"""
+        objvs = [Objv(2, 1), Objv(2, 1)]
+        calls = []
+        tasklist = [["t1", [calls]]]
+        taskdict = {"t1": fcount}
+        parnames = ["p0", "p1"]
+        config = dict(ev.DEFAULT_CONFIG, cachefitness=True)
+        evaluator = ev.Evaluator(objvs, tasklist, taskdict, parnames, config=config)
+        for ii, par in enumerate([[2.0, 1.0], [2.0, 1.5], [2.0, 1.0]]):
+            fitness = evaluator(par, ii)
+            self.assertEqual(fitness, 2)
+        self.assertEqual(calls, [[2.0, 1.0], [2.0, 1.5]])
+        # evaluation-only runs pass no parameters; nothing to cache
+        calls.clear()
+        evaluator = ev.Evaluator(objvs, tasklist, taskdict, None, config=config)
+        for ii in range(2):
+            self.assertEqual(evaluator(None, ii), 2)
+        self.assertEqual(calls, [None, None])
+        # no caching by default
+        calls.clear()
+        evaluator = ev.Evaluator(objvs, tasklist, taskdict, parnames)
+        evaluator([2.0, 1.0], 0)
+        evaluator([2.0, 1.0], 1)
+        self.assertEqual(len(calls), 2)
+
 
 if __name__ == "__main__":
     unittest.main()
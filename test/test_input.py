@@ -1,6 +1,9 @@
 """Test correct parsing of input file"""
+
 import os
+import tempfile
 import unittest
+import yaml
 import logging
 from skpar.core.input import parse_input, get_input, get_config
 from skpar.core.usertasks import update_taskdict
@@ -29,6 +32,15 @@ class ReadInputTest(unittest.TestCase):
         # print (data2)
         self.assertDictEqual(data1, data2)
 
+    def test_cached_input(self):
+        """Do repeated reads return equal but independent copies?"""
+        infile = "test_input.yaml"
+        data1 = get_input(infile)
+        data1["config"] = None
+        data2 = get_input(infile)
+        self.assertIsNotNone(data2["config"])
+        self.assertIsNot(data1, data2)
+
     def test_parse_nonexistent(self):
         """Can we report neatly that input file is missing?"""
         filename = "skpar_noinput.yaml"
@@ -39,6 +51,15 @@ class ReadInputTest(unittest.TestCase):
 
         self.assertRaises(FileNotFoundError, wrapper)
 
+    def test_invalid_yaml(self):
+        """Is invalid YAML reported by re-raising the parser error?"""
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml", delete=False) as tmp:
+            tmp.write("tasks: [unclosed\n")
+        try:
+            self.assertRaises(yaml.YAMLError, get_input, tmp.name)
+        finally:
+            os.remove(tmp.name)
+
 
 class ParseConfigTest(unittest.TestCase):
     """Check configuration is interpreted properly"""
@@ -52,6 +73,7 @@ class ParseConfigTest(unittest.TestCase):
             "templatedir": os.path.abspath("./test_optimise"),
             "workroot": os.path.abspath("./_workdir/test_optimise"),
             "keepworkdirs": True,
+            "cachefitness": False,
         }
         self.assertDictEqual(refdict, config)
         return config
@@ -1,8 +1,12 @@
+import pickle
 import unittest
 import logging
 import numpy as np
 import numpy.testing as nptest
 from skpar.dftbutils.lattice import Lattice, repr_lattice, get_dftbp_klines
+from skpar.dftbutils.lattice import getSymPtLabel, get_sympts_batch
+from skpar.dftbutils.lattice import getkLineLength, get_kpath_lengths
+from skpar.dftbutils.lattice import get_segment_lengths, get_lattice
 
 logging.basicConfig(level=logging.DEBUG)
 logging.basicConfig(format="%(message)s")
@@ -21,6 +25,9 @@ class LatticeTest(unittest.TestCase):
         latinfo = {"type": "BCC", "param": 1.0}
         lat = Lattice(latinfo)
         logger.debug(lat)
+        # no round-off of the cell inversion: exact (positive) zeros
+        self.assertEqual(np.count_nonzero(lat.reciprv == 0), 3)
+        self.assertFalse(np.signbit(lat.reciprv).any())
 
     def test_facecenteredcubic(self):
         """Face centered cubic (FCC)"""
@@ -71,6 +78,87 @@ class LatticeTest(unittest.TestCase):
         lat = Lattice({"type": "MCLC", "param": [a, b, c, beta]})
         logger.debug(lat)
 
+    def test_get_kvec_batch(self):
+        """Can we convert many k-points at once?"""
+        lat = Lattice({"type": "FCC", "param": 5.43})
+        kpts = [lat.SymPts_k[lbl] for lbl in ("Gamma", "X", "L")]
+        kvecs = lat.get_kvec(kpts)
+        self.assertEqual(kvecs.shape, (3, 3))
+        for kpt, kvec in zip(kpts, kvecs):
+            nptest.assert_allclose(lat.get_kvec(kpt), kvec)
+        nptest.assert_allclose(kvecs[1], lat.SymPts["X"])
+
+    def test_getsymptlabel(self):
+        """Are symmetry points recognised, also when given approximately?"""
+        lat = Lattice({"type": "HEX", "param": [1.0, 2.0]})
+        self.assertEqual(getSymPtLabel([0.5, 0.0, 0.5], lat), "L")
+        self.assertEqual(getSymPtLabel([0.33333, 0.33333, 0.5], lat), "H")
+        self.assertEqual(getSymPtLabel([0.33328, 0.3334, 0.0], lat), "K")
+        label = getSymPtLabel([0.1, -0.25, 1.0 / 3.0], lat)
+        self.assertEqual(label, "(1/10, -1/4, 1/3)")
+
+    def test_sympts_batch(self):
+        """Are symmetry points of many lattices the same as one by one?"""
+        params = [[1.0, 2.0], [3.2, 5.1], [2.5, 2.5]]
+        labels, sympts = get_sympts_batch("HEX", params)
+        self.assertEqual(sympts.shape, (3, len(labels), 3))
+        for param, pts in zip(params, sympts):
+            lat = Lattice({"type": "HEX", "param": param})
+            for label, pt in zip(labels, pts):
+                nptest.assert_allclose(lat.SymPts[label], pt, atol=1.0e-12)
+
+    def test_kpath_lengths(self):
+        """Are k-path segment lengths the same as one segment at a time?"""
+        lat = Lattice({"type": "FCC", "param": 5.431})
+        path = ("L", "Gamma", "X", "U", "K")
+        kpts = [lat.SymPts_k[pt] for pt in path]
+        seglens = get_kpath_lengths(kpts, lat.reciprv)
+        nptest.assert_allclose(seglens, get_segment_lengths(lat, path))
+        nptest.assert_allclose(
+            get_kpath_lengths(kpts, lat.reciprv, lat.constants[0] / (2 * np.pi)),
+            seglens * lat.constants[0] / (2 * np.pi),
+        )
+        for kpt0, kpt1, seglen in zip(kpts[:-1], kpts[1:], seglens):
+            self.assertAlmostEqual(getkLineLength(kpt0, kpt1, lat.reciprv), seglen)
+
+    def test_cached_lattice(self):
+        """Do equal lattices share cached data but not their containers?"""
+        lat1 = Lattice({"type": "TET", "param": [8.9385, 12.9824]})
+        lat2 = Lattice({"type": "TET", "param": [8.9385, 12.9824]})
+        self.assertIs(lat1.reciprv, lat2.reciprv)
+        self.assertFalse(lat1.reciprv.flags.writeable)
+        self.assertTrue(lat1.reciprv.flags.c_contiguous)
+        self.assertIsNot(lat1.SymPts, lat2.SymPts)
+        self.assertIsNot(lat1.SymPts_k, lat2.SymPts_k)
+        self.assertIsNot(lat1.constants, lat2.constants)
+        self.assertFalse(lat1.primv.flags.writeable)
+        self.assertFalse(lat1.convv.flags.writeable)
+        lat1.SymPts_k["Q"] = [0.5, 0.5, 0.5]
+        lat4 = Lattice({"type": "TET", "param": [8.9385, 12.9824]})
+        self.assertNotIn("Q", lat4.SymPts_k)
+        lat3 = Lattice({"type": "TET", "param": [8.9385, 13.0]})
+        self.assertFalse(np.allclose(lat1.SymPts["Z"], lat3.SymPts["Z"]))
+
+    def test_pickle(self):
+        """Can lattices be pickled, e.g. along with the model database?"""
+        for latinfo in (
+            {"type": "FCC", "param": 5.43},
+            {"type": "RHL", "param": [5.32208613808, 55.8216166097]},
+        ):
+            lat = Lattice(latinfo)
+            lat2 = pickle.loads(pickle.dumps(lat))
+            self.assertEqual(lat.SymPts_k, lat2.SymPts_k)
+            nptest.assert_array_equal(lat.reciprv, lat2.reciprv)
+
+    def test_unsupported_setting(self):
+        """Is an unknown lattice setting rejected?"""
+        latinfo = {"type": "FCC", "param": 1.0, "setting": "unknown"}
+        self.assertRaises(SystemExit, Lattice, latinfo)
+        # the simple cubic cell accepts any setting
+        latinfo = {"type": "CUB", "param": 1.0, "setting": "unknown"}
+        self.assertEqual(Lattice(latinfo).setting, "unknown")
+        self.assertIsNone(get_lattice["CUB"](1.0).setting)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import os
 import unittest
 import logging
 import numpy as np
@@ -6,6 +7,7 @@ import yaml
 from skpar.core import objectives as oo
 from skpar.core.database import Database, Query
 from skpar.core.evaluate import relerr
+from skpar.core.utils import get_range_indexes
 
 np.set_printoptions(precision=3, formatter={"float_kind": lambda x: "%.2f" % x})
 
@@ -260,6 +262,33 @@ class ObjectiveRefDataTest(unittest.TestCase):
         res = oo.get_refdata(ref_input)
         nptest.assert_array_equal(res, exp, verbose=True)
 
+    def test_file_reloaded(self):
+        """Do repeated loads of a file return independent, equal arrays?"""
+        ref_input = {
+            "file": "./reference_data/refdata_example.dat",
+            "loader_args": {"unpack": False},
+        }
+        res1 = oo.get_refdata(ref_input)
+        res1.flags.writeable = True
+        res1 -= 1.0
+        res2 = oo.get_refdata(ref_input)
+        nptest.assert_array_equal(res2, res1 + 1.0, verbose=True)
+
+    def test_file_changed(self):
+        """Is a file changed on disk loaded anew, replacing the old data?"""
+        fname = "refdata_changed.dat"
+        ref_input = {"file": fname, "loader_args": {"unpack": False}}
+        try:
+            for i in range(3):
+                np.savetxt(fname, np.full((2, 3), float(i)))
+                # make sure the modification time differs for each new content
+                os.utime(fname, ns=(i * 10**9, i * 10**9))
+                nptest.assert_array_equal(oo.get_refdata(ref_input), i)
+            path = os.path.abspath(fname)
+            self.assertEqual(sum(key[0] == path for key in oo._REFDATA_FILES), 1)
+        finally:
+            os.remove(fname)
+
     def test_process(self):
         """Can we handle file data and post-process it?"""
         ref_input = {
@@ -328,6 +357,13 @@ class GetRangesTest(unittest.TestCase):
         res = oo.get_ranges(data)
         self.assertEqual(res, exp, msg="r:{}, e:{}".format(res, exp))
 
+    def test_get_range_indexes(self):
+        """Can we flatten overlapping ranges into sorted unique indexes?"""
+        data = [7, [3, 5], [1, 4], 5]
+        exp = [0, 1, 2, 3, 4, 6]
+        res = get_range_indexes(data)
+        nptest.assert_array_equal(res, exp)
+
 
 class GetSubsetIndTest(unittest.TestCase):
     """Can we obtain an index array from a specification of a given set of ranges"""
@@ -632,6 +668,9 @@ class ObjectiveTypesTest(unittest.TestCase):
         nptest.assert_array_equal(mdat, np.asarray(dat[0:2]), verbose=True)
         nptest.assert_array_equal(rdat, ref, verbose=True)
         nptest.assert_array_equal(weights, subw, verbose=True)
+        # queries over several models yield several values per key
+        objv.queries = [Query(["Si/bs", "Si/bs"], key) for key in objv.query_key]
+        self.assertRaises(ValueError, objv.get, database)
 
     def test_objtype_weightedsum(self):
         """Can we create objective from pairs of value-weight"""
@@ -764,6 +803,29 @@ class ObjectiveTypesTest(unittest.TestCase):
         nptest.assert_array_equal(rdat, ref, verbose=True)
         nptest.assert_array_equal(weights, subw, verbose=True)
 
+    def test_objtype_bands_aligned_whole(self):
+        """Can we align all bands, without altering those in the database?"""
+        yamldata = """objectives:
+            - bands:
+                models: Si/bs
+                ref:
+                    file: ./reference_data/fakebands.dat
+                    loader_args: {unpack: True}
+                    process:
+                        rm_columns: 1
+                options:
+                    align_ref: [3, max]
+                    align_model: [3, max]
+            """
+        spec = yaml.safe_load(yamldata)["objectives"][0]
+        objv = oo.get_objective(spec)
+        data = np.loadtxt("reference_data/fakebands.dat", unpack=True)[1:]
+        database = Database()
+        database.update("Si/bs", {"bands": data.copy()})
+        mdat, rdat, weights = objv.get(database)
+        nptest.assert_array_equal(database.get_item("Si/bs", "bands"), data)
+        nptest.assert_array_equal(mdat, data - data[2].max())
+
 
 class SetObjectivesTest(unittest.TestCase):
     """Check if we can create objectives from skpar_in.yaml"""
@@ -4,10 +4,13 @@ import numpy as np
 import numpy.testing as nptest
 import os
 import sys
+import tempfile
+import yaml
 from os.path import abspath, normpath, expanduser
 from skpar.core.input import parse_input
 from skpar.core.evaluate import Evaluator, eval_objectives, cost_rms, create_workdir
 from skpar.core.optimise import Optimiser, get_optargs
+from skpar.core.skpar import SKPAR
 from skpar.core.database import Database, Query
 from skpar.core.tasks import initialise_tasks
 from skpar.core import taskdict as core_taskdict
@@ -122,6 +125,21 @@ class OptimiseTest(unittest.TestCase):
         ideal = np.array([10.0, -2.5, 0.5, 0.05])
         nptest.assert_almost_equal(gbestpars, ideal, decimal=2)
 
+    def test_nproc_requires_workroot(self):
+        """Is parallel evaluation refused without individual workdirs?"""
+        with open("skpar_in_optimise.yaml") as fh:
+            userinp = yaml.safe_load(fh)
+        del userinp["config"]["workroot"]
+        userinp["optimisation"]["options"]["nproc"] = 2
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".yaml", dir=".", delete=False
+        ) as tmp:
+            yaml.safe_dump(userinp, tmp)
+        try:
+            self.assertRaises(SystemExit, SKPAR, tmp.name)
+        finally:
+            os.remove(tmp.name)
+
 
 class EvaluateSiTest(unittest.TestCase):
     """
@@ -1,6 +1,7 @@
 """Test particle swarm optimisation module"""
 import unittest
 import logging
+import random
 import numpy as np
 import numpy.testing as nptest
 from numpy.polynomial.polynomial import polyval
@@ -13,6 +14,11 @@ logging.basicConfig(format="%(message)s")
 LOGGER = logging.getLogger(__name__)
 
 
+def sphere(parameters, iteration):
+    """Module-level evaluator, so that it can be sent to worker processes."""
+    return np.atleast_1d(np.sqrt(np.sum(np.square(parameters))))
+
+
 class PSOTest(unittest.TestCase):
     """
     A small test and usage example of the PSO engine.
@@ -89,6 +95,18 @@ class PSOTest(unittest.TestCase):
         nptest.assert_allclose(swarm.gbest.renormalized, coef, rtol=0.1, verbose=True)
         self.assertTrue(swarm.gbest.fitness.values[0] < 0.2)
 
+    def test_pso_nproc(self):
+        """Do parallel evaluations of the particles reproduce the serial run?"""
+        prange = [(-1, 1), (-2, 2), (-3, 3)]
+        results = []
+        for nproc in (1, 2):
+            random.seed(7)
+            pso = PSO(prange, sphere, npart=6, ngen=5, nproc=nproc)
+            swarm, stats = pso()
+            results.append((swarm.gbest.renormalized, swarm.gbest_iteration))
+        nptest.assert_array_equal(results[0][0], results[1][0])
+        self.assertEqual(results[0][1], results[1][1])
+
 
 class ParticleTest(unittest.TestCase):
     """Test creation and evolution of particles for the PSO"""